@@ -1,26 +1,42 @@
 import os
 import sys
+import collections
+import io
 import subprocess
 import re
 import time
 import gradio as gr
 import logging
+import logging.handlers
+import queue
 import zipfile
+import tarfile
 import requests
 import threading
+import selectors
+import functools
+import atexit
 import shutil
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging
+# Configure logging (records are written by a background listener so disk I/O
+# never blocks the threads that emit them)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("steamcmd_downloader.log"),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("steamcmd_downloader.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("SteamCMD-Downloader")
 
 # Configuration
@@ -29,27 +45,137 @@ STEAMCMD_EXE = os.path.join(STEAMCMD_DIR, "steamcmd.exe") if sys.platform == "wi
 GAMES_DIR = os.path.join(os.getcwd(), "games")
 PUBLIC_DIR = os.path.join(os.getcwd(), "public")
 STEAMCMD_DOWNLOAD_URL = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip" if sys.platform == "win32" else "https://steamcdn-a.akamaihd.net/client/installer/steamcmd_linux.tar.gz"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB buffers for bulk file reads/writes
+STDOUT_READ_SIZE = 64 * 1024  # Max bytes of SteamCMD output consumed per wakeup
+MAX_LOG_LINES = 500  # Most recent SteamCMD output lines kept per download
+
+# Precompiled patterns for parsing raw (bytes) SteamCMD output
+_PROGRESS_RE = re.compile(rb'(\d+\.?\d*)%')
+_SIZE_RE = re.compile(rb'(\d+\.?\d*)\s*(KB|MB|GB|B)\s*/\s*(\d+\.?\d*)\s*(KB|MB|GB|B)')
+
+# Multipliers converting the size units SteamCMD reports to MB
+_UNIT_MB = {b"B": 1 / 1048576, b"KB": 1 / 1024, b"MB": 1.0, b"GB": 1024.0}
+
+# SteamCMD output markers that end a download ("Success!" or an error). SteamCMD
+# writes "Error!" in both cases, so that one is checked case-insensitively
+_TERMINAL_TOKENS = ("Success!", "Failed", "Login Failure", "FAILED")
+
+# Per-app result lines, e.g. "Success! App '730' fully installed.",
+# "ERROR! Failed to install app '730' (...)" or "Error! App '730' state is 0x202 ...".
+# Progress lines don't name the app, so the queue only advances on these
+_APP_SUCCESS_RE = re.compile(r"Success! App '(\d+)'")
+_APP_ERROR_RE = re.compile(r"(?i)error!.*?\bapp '(\d+)'")
+
+# Markers SteamCMD prints when the login is rejected (e.g. "FAILED login with result code ...")
+_LOGIN_FAILURE_TOKENS = ("Login Failure", "FAILED")
+
+def _is_terminal_line(line):
+    """Check whether a SteamCMD output line reports a result or an error"""
+    if any(token in line for token in _TERMINAL_TOKENS):
+        return True
+    # Progress lines have no "!", so they skip the lower() copy
+    return "!" in line and "error!" in line.lower()
 
 # Ensure directories exist
 os.makedirs(STEAMCMD_DIR, exist_ok=True)
 os.makedirs(GAMES_DIR, exist_ok=True)
 os.makedirs(PUBLIC_DIR, exist_ok=True)
 
+class _Reaper:
+    """Services the stdout pipes of all running SteamCMD processes from a single thread"""
+    
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def register(self, fileobj, callback, on_error):
+        """Watch a pipe and call callback(fd) whenever it has output or reaches EOF.
+        
+        If callback raises, the pipe is unregistered and on_error() is called so
+        the owner can clean up.
+        """
+        os.set_blocking(fileobj.fileno(), False)
+        with self._lock:
+            self._selector.register(fileobj, selectors.EVENT_READ, (callback, on_error))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+    
+    def unregister(self, fileobj):
+        """Stop watching a pipe"""
+        with self._lock:
+            self._selector.unregister(fileobj)
+    
+    def _run(self):
+        """Dispatch ready pipes to their callbacks until nothing is left to watch"""
+        while True:
+            with self._lock:
+                if not self._selector.get_map():
+                    # The next register() call starts a fresh thread
+                    self._thread = None
+                    return
+            
+            for key, _ in self._selector.select(timeout=0.5):
+                callback, on_error = key.data
+                try:
+                    callback(key.fd)
+                except Exception as e:
+                    logger.error(f"Output monitor error: {str(e)}")
+                    try:
+                        self.unregister(key.fileobj)
+                    except KeyError:
+                        pass
+                    try:
+                        on_error()
+                    except Exception as e:
+                        logger.error(f"Output monitor cleanup error: {str(e)}")
+
+# Shared by every download, so N running SteamCMD processes need one monitor thread
+_reaper = _Reaper()
+
 class SteamCMDDownloader:
     def __init__(self):
         self.process = None
         self.current_download = {
             "game_id": None,
+            "game_ids": [],
+            "completed_ids": [],
+            "app_status": {},
             "progress": 0,
             "status": "idle",
             "start_time": None,
+            "app_start_time": None,
             "current_size": 0,
             "total_size": 0,
             "speed": 0,
             "remaining_time": None,
-            "log": []
+            "error": None,
+            "log": collections.deque(maxlen=MAX_LOG_LINES)
         }
         self.public_links = []
+        self._running = False
+        self._pending_output = b""
+        self._workers = []
+        
+        # Guards current_download, which the monitor thread writes and the UI reads
+        self._lock = threading.Lock()
+        
+        # Bumped whenever the download state changes; keys the status cache
+        self._status_version = 0
+        self._status_cache = (None, None)
+        self._debug_output = False
+        
+        # Shared HTTP session so connections are kept alive across requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        atexit.register(self.session.close)
     
     def check_steamcmd_installed(self):
         """Check if SteamCMD is installed and in the expected location"""
@@ -63,28 +189,25 @@ class SteamCMDDownloader:
         try:
             logger.info("Installing SteamCMD...")
             
-            # Download SteamCMD
-            response = requests.get(STEAMCMD_DOWNLOAD_URL, stream=True)
-            response.raise_for_status()
-            
-            # Save the download
-            download_path = os.path.join(STEAMCMD_DIR, "steamcmd_installer")
-            if sys.platform == "win32":
-                download_path += ".zip"
-            else:
-                download_path += ".tar.gz"
+            # Download SteamCMD and extract it straight from the response
+            with self.session.get(STEAMCMD_DOWNLOAD_URL, stream=True, timeout=(5, 30)) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
                 
-            with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            # Extract the download
-            if sys.platform == "win32":
-                with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                    zip_ref.extractall(STEAMCMD_DIR)
-            else:
-                subprocess.run(["tar", "-xzf", download_path, "-C", STEAMCMD_DIR], check=True)
-                subprocess.run(["chmod", "+x", STEAMCMD_EXE], check=True)
+                if sys.platform == "win32":
+                    # Zip archives need random access, so buffer the archive in memory
+                    archive = io.BytesIO()
+                    shutil.copyfileobj(response.raw, archive, length=DOWNLOAD_CHUNK_SIZE)
+                    with zipfile.ZipFile(archive) as zip_ref:
+                        zip_ref.extractall(STEAMCMD_DIR)
+                else:
+                    with tarfile.open(fileobj=response.raw, mode="r|gz") as tar_ref:
+                        # Reject absolute paths and ".." members where the data filter exists (3.9.17+)
+                        if hasattr(tarfile, "data_filter"):
+                            tar_ref.extractall(STEAMCMD_DIR, filter="data")
+                        else:
+                            tar_ref.extractall(STEAMCMD_DIR)
+                    os.chmod(STEAMCMD_EXE, os.stat(STEAMCMD_EXE).st_mode | 0o111)
             
             # Verify installation
             if not self.check_steamcmd_installed():
@@ -93,7 +216,7 @@ class SteamCMDDownloader:
                 
             logger.info("SteamCMD installed successfully")
             # Run SteamCMD once to update itself
-            self._run_steamcmd_command("+quit")
+            self._run_steamcmd_command(["+quit"])
             return True
             
         except Exception as e:
@@ -106,75 +229,58 @@ class SteamCMDDownloader:
         if game_input.isdigit():
             return game_input
             
-        # Try to extract ID from URL
-        match = re.search(r'app/(\d+)', game_input)
-        if match:
-            return match.group(1)
+        # Try to extract ID from URL (the digits following "app/")
+        start = game_input.find("app/")
+        if start >= 0:
+            start += 4
+            end = start
+            while end < len(game_input) and game_input[end].isdigit():
+                end += 1
+            if end > start:
+                return game_input[start:end]
             
         # If we can't extract an ID, return None
         return None
     
-    def _run_steamcmd_command(self, command):
-        """Run a SteamCMD command and return the output"""
-        full_command = f"{STEAMCMD_EXE} {command}"
-        process = subprocess.run(full_command, shell=True, capture_output=True, text=True)
+    def _run_steamcmd_command(self, args):
+        """Run SteamCMD with a list of arguments and return the output"""
+        process = subprocess.run([STEAMCMD_EXE, *args], capture_output=True, text=True, check=False)
         return process.stdout, process.stderr
     
-    def login(self, username, password, anonymous=False):
-        """Attempt to login to Steam via SteamCMD"""
-        try:
-            if anonymous:
-                logger.info("Logging in anonymously...")
-                cmd = "+login anonymous"
-            else:
-                logger.info(f"Logging in as {username}...")
-                cmd = f"+login {username} {password}"
-                
-            stdout, stderr = self._run_steamcmd_command(cmd + " +quit")
-            
-            if "Login Failure" in stdout or "FAILED" in stdout:
-                logger.error("Login failed")
-                return False, "Login failed. Please check your credentials."
-                
-            logger.info("Login successful")
-            return True, "Login successful"
-            
-        except Exception as e:
-            logger.error(f"Login error: {str(e)}")
-            return False, f"Login error: {str(e)}"
-    
-    def _parse_progress(self, line):
-        """Parse SteamCMD output to extract download progress information"""
-        # Update progress percentage
-        progress_match = re.search(r'(\d+\.?\d*)%', line)
-        if progress_match:
-            self.current_download["progress"] = float(progress_match.group(1))
+    def _login_args(self, username, password, anonymous=False):
+        """Build the SteamCMD login arguments"""
+        if anonymous:
+            return ["+login", "anonymous"]
+        return ["+login", username, password]
+    
+    def _parse_progress(self, data):
+        """Parse a batch of raw SteamCMD output to extract download progress information"""
+        # Skip batches that cannot contain progress or size information
+        if b'%' not in data and b'/' not in data:
+            return
+        
+        # Only the most recent values matter, so take the last match in the batch
+        progress_matches = _PROGRESS_RE.findall(data)
+        if progress_matches:
+            self.current_download["progress"] = float(progress_matches[-1])
+            self._status_version += 1
         
         # Update download size information
-        size_match = re.search(r'(\d+\.?\d*) (\w+) / (\d+\.?\d*) (\w+)', line)
-        if size_match:
-            current_size = float(size_match.group(1))
-            current_unit = size_match.group(2)
-            total_size = float(size_match.group(3))
-            total_unit = size_match.group(4)
+        size_matches = _SIZE_RE.findall(data)
+        if size_matches:
+            current_size, current_unit, total_size, total_unit = size_matches[-1]
             
             # Convert to MB for consistent tracking
-            if current_unit == "KB":
-                current_size /= 1024
-            elif current_unit == "GB":
-                current_size *= 1024
-                
-            if total_unit == "KB":
-                total_size /= 1024
-            elif total_unit == "GB":
-                total_size *= 1024
+            current_size = float(current_size) * _UNIT_MB[current_unit]
+            total_size = float(total_size) * _UNIT_MB[total_unit]
                 
             self.current_download["current_size"] = current_size
             self.current_download["total_size"] = total_size
+            self._status_version += 1
             
             # Calculate speed and remaining time
-            if self.current_download["start_time"]:
-                elapsed_time = (datetime.now() - self.current_download["start_time"]).total_seconds()
+            if self.current_download["app_start_time"] is not None:
+                elapsed_time = time.monotonic() - self.current_download["app_start_time"]
                 if elapsed_time > 0:
                     self.current_download["speed"] = current_size / elapsed_time  # MB/s
                     
@@ -183,101 +289,320 @@ class SteamCMDDownloader:
                         remaining_seconds = remaining_mb / self.current_download["speed"]
                         self.current_download["remaining_time"] = timedelta(seconds=int(remaining_seconds))
     
-    def download_game(self, game_input, username, password, anonymous=False):
-        """Download a game using SteamCMD"""
-        game_id = self._extract_game_id(game_input)
-        if not game_id:
-            return False, "Invalid game ID or URL"
-            
-        # Reset current download state
-        self.current_download = {
-            "game_id": game_id,
-            "progress": 0,
-            "status": "preparing",
-            "start_time": datetime.now(),
-            "current_size": 0,
-            "total_size": 0,
-            "speed": 0,
-            "remaining_time": None,
-            "log": []
-        }
+    def download_game(self, game_inputs, username, password, anonymous=False):
+        """Download one or more games (IDs or URLs) in a single SteamCMD run"""
+        # All download state lives on this object, so only one run at a time
+        if self.is_running():
+            return False, "A download is already in progress"
         
-        game_dir = os.path.join(GAMES_DIR, f"app_{game_id}")
-        os.makedirs(game_dir, exist_ok=True)
+        if isinstance(game_inputs, str):
+            game_inputs = [game_inputs]
+        if not game_inputs:
+            return False, "Invalid game ID or URL"
         
-        # Build SteamCMD command
-        if anonymous:
-            login_cmd = "+login anonymous"
-        else:
-            login_cmd = f"+login {username} {password}"
+        game_ids = []
+        for game_input in game_inputs:
+            game_id = self._extract_game_id(game_input)
+            if not game_id:
+                return False, f"Invalid game ID or URL: {game_input}"
+            if game_id not in game_ids:
+                game_ids.append(game_id)
             
-        download_cmd = f"{login_cmd} +force_install_dir {game_dir} +app_update {game_id} validate +quit"
+        # Reset current download state
+        self._reset_download(game_ids)
         
         # Start download process
         try:
-            logger.info(f"Starting download for game ID: {game_id}")
-            self.current_download["status"] = "downloading"
+            # Build SteamCMD arguments: one login, then every app update in the same run
+            download_args = self._login_args(username, password, anonymous)
+            for game_id in game_ids:
+                game_dir = os.path.join(GAMES_DIR, f"app_{game_id}")
+                try:
+                    os.makedirs(game_dir)
+                except FileExistsError:
+                    pass
+                download_args += ["+force_install_dir", game_dir, "+app_update", game_id, "validate"]
+            download_args.append("+quit")
+            
+            logger.info(f"Starting download for game ID(s): {', '.join(game_ids)}")
+            with self._lock:
+                self.current_download["status"] = "downloading"
+                self._status_version += 1
             
             # Start the process
             self.process = subprocess.Popen(
-                [STEAMCMD_EXE] + download_cmd.split(), 
+                [STEAMCMD_EXE, *download_args], 
                 stdout=subprocess.PIPE, 
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=STDOUT_READ_SIZE
             )
             
-            # Start a thread to monitor the process output
-            monitor_thread = threading.Thread(target=self._monitor_download_progress)
-            monitor_thread.daemon = True
-            monitor_thread.start()
+            # Monitor the process output; pipes can't be selected on Windows, so use a thread there
+            self._debug_output = logger.isEnabledFor(logging.DEBUG)
+            self._pending_output = b""
+            self._workers = []
+            self._running = True
+            if sys.platform == "win32":
+                monitor_thread = threading.Thread(target=self._monitor_download_progress, args=(self.process,))
+                monitor_thread.daemon = True
+                monitor_thread.start()
+            else:
+                _reaper.register(
+                    self.process.stdout,
+                    functools.partial(self._on_stdout, self.process),
+                    functools.partial(self._on_monitor_error, self.process)
+                )
             
             return True, "Download started"
             
         except Exception as e:
             logger.error(f"Download error: {str(e)}")
-            self.current_download["status"] = "error"
-            self.current_download["log"].append(f"Error: {str(e)}")
+            with self._lock:
+                self.current_download["status"] = "error"
+                self.current_download["log"].append(f"Error: {str(e)}")
+                self._status_version += 1
             return False, f"Download error: {str(e)}"
     
-    def _monitor_download_progress(self):
-        """Monitor the SteamCMD download process and update status"""
-        for line in iter(self.process.stdout.readline, ''):
-            self.current_download["log"].append(line.strip())
-            logger.debug(line.strip())
-            
-            # Parse progress information
-            self._parse_progress(line)
+    def _reset_download(self, game_ids):
+        """Start fresh download state for the queued game IDs (first one active)"""
+        now = time.monotonic()
+        with self._lock:
+            self.current_download = {
+                "game_id": game_ids[0],
+                "game_ids": game_ids,
+                "completed_ids": [],
+                "app_status": {gid: "queued" for gid in game_ids},
+                "progress": 0,
+                "status": "preparing",
+                "start_time": now,
+                "app_start_time": now,
+                "current_size": 0,
+                "total_size": 0,
+                "speed": 0,
+                "remaining_time": None,
+                "error": None,
+                "log": collections.deque(maxlen=MAX_LOG_LINES)
+            }
+            self.current_download["app_status"][game_ids[0]] = "downloading"
+            self.public_links = []
+            self._status_version += 1
+    
+    def _handle_output_line(self, line):
+        """Record a single line of SteamCMD output and update the download state.
+        
+        Must be called with the lock held. Returns the ID of the game whose
+        download the line reports as successful, or None.
+        """
+        stripped = line.strip()
+        if not stripped:
+            return None
+        download = self.current_download
+        download["log"].append(stripped)
+        if self._debug_output:
+            logger.debug(stripped)
+        
+        # Check for completion or error
+        if not _is_terminal_line(stripped):
+            return None
+        
+        if "Success!" in stripped:
+            match = _APP_SUCCESS_RE.search(stripped)
+            return self._finish_game(match.group(1) if match else download["game_id"], "completed")
+        
+        if any(token in stripped for token in _LOGIN_FAILURE_TOKENS):
+            logger.error("Login failed")
+            download["error"] = "Login failed. Please check your credentials."
+            download["status"] = "error"
+            self._status_version += 1
+            return None
+        
+        match = _APP_ERROR_RE.search(stripped)
+        if match:
+            self._finish_game(match.group(1), "error")
+        
+        # Other "Failed"/"ERROR!" lines (e.g. "Failed to init SDL priority manager")
+        # don't end an app; the final status comes from the per-app results
+        return None
+    
+    def _activate_game(self, game_id):
+        """Make game_id the app whose progress is being reported (lock held)"""
+        download = self.current_download
+        download["game_id"] = game_id
+        download["app_status"][game_id] = "downloading"
+        download["app_start_time"] = time.monotonic()
+        download["progress"] = 0
+        download["current_size"] = 0
+        download["total_size"] = 0
+        download["speed"] = 0
+        download["remaining_time"] = None
+        self._status_version += 1
+    
+    def _finish_game(self, game_id, result):
+        """Record an app's result and move on to the next queued one.
+        
+        Must be called with the lock held. Returns game_id if it completed
+        successfully, otherwise None.
+        """
+        download = self.current_download
+        if game_id not in download["app_status"]:
+            return None
+        download["app_status"][game_id] = result
+        if result == "completed" and game_id not in download["completed_ids"]:
+            download["completed_ids"].append(game_id)
+        self._status_version += 1
+        
+        # SteamCMD processes the +app_update directives in order
+        if game_id == download["game_id"]:
+            queued = [gid for gid in download["game_ids"] if download["app_status"][gid] == "queued"]
+            if queued:
+                self._activate_game(queued[0])
+        
+        # The run is over once no app is left queued or in progress
+        if all(status in ("completed", "error") for status in download["app_status"].values()):
+            if len(download["completed_ids"]) == len(download["game_ids"]):
+                download["progress"] = 100
+                download["status"] = "completed"
+            else:
+                download["status"] = "error"
+        
+        return game_id if result == "completed" else None
+    
+    def _handle_output(self, data):
+        """Update the download state from a batch of complete SteamCMD output lines"""
+        completed_ids = []
+        with self._lock:
+            # Decode the batch once, only for the text that is logged and checked
+            lines = data.decode("utf-8", "replace").split('\n')
+            raw_lines = None
+            segment_start = 0
+            for index, line in enumerate(lines):
+                # Lines that may finish an app split the batch, so progress
+                # printed before them is applied to the app it belongs to
+                if _is_terminal_line(line) and index > segment_start:
+                    raw_lines = raw_lines or data.split(b'\n')
+                    self._parse_progress(b'\n'.join(raw_lines[segment_start:index]))
+                    segment_start = index
+                game_id = self._handle_output_line(line)
+                if game_id:
+                    completed_ids.append(game_id)
             
-            # Check for completion or error
-            if "Success!" in line:
-                self.current_download["status"] = "completed"
-                self.current_download["progress"] = 100
-                self._create_public_links()
+            # Progress is otherwise scanned once per batch rather than once per line
+            if segment_start:
+                data = b'\n'.join(raw_lines[segment_start:])
+            self._parse_progress(data)
+        
+        # Building the manifest walks the whole install, so keep it outside the lock
+        # and off the output monitor
+        for game_id in completed_ids:
+            self._run_in_worker(self._create_public_links, game_id)
+    
+    def _run_in_worker(self, target, *args):
+        """Run slow follow-up work (manifest walks, process reaping) on its own thread"""
+        worker = threading.Thread(target=target, args=args, daemon=True)
+        worker.start()
+        self._workers.append(worker)
+    
+    def _feed_output(self, chunk):
+        """Buffer raw SteamCMD output and handle every complete line received so far"""
+        pending = self._pending_output + chunk.replace(b'\r', b'\n')
+        batch, newline, self._pending_output = pending.rpartition(b'\n')
+        if newline:
+            self._handle_output(batch)
+    
+    def _on_stdout(self, process, fd):
+        """Reaper callback: consume whatever output a SteamCMD process has produced"""
+        try:
+            chunk = os.read(fd, STDOUT_READ_SIZE)
+        except BlockingIOError:
+            return
+        if chunk:
+            self._feed_output(chunk)
+            return
+        
+        # EOF: SteamCMD has closed its output. Waiting for it to exit can take a
+        # while, so don't hold up the other pipes on the shared monitor thread
+        _reaper.unregister(process.stdout)
+        process.stdout.close()
+        threading.Thread(target=self._finish_download, args=(process,), daemon=True).start()
+    
+    def _on_monitor_error(self, process):
+        """Reaper error callback: stop reading the output and settle the download anyway"""
+        with self._lock:
+            self.current_download["log"].append("Lost track of the SteamCMD output")
+            self._status_version += 1
+        process.stdout.close()
+        threading.Thread(target=self._finish_download, args=(process,), daemon=True).start()
+    
+    def _monitor_download_progress(self, process):
+        """Monitor the SteamCMD download process with blocking reads and update status"""
+        fd = process.stdout.fileno()
+        try:
+            while True:
+                chunk = os.read(fd, STDOUT_READ_SIZE)
+                if not chunk:
+                    break
+                self._feed_output(chunk)
+        except Exception as e:
+            logger.error(f"Output monitor error: {str(e)}")
+            with self._lock:
+                self.current_download["log"].append("Lost track of the SteamCMD output")
+        self._finish_download(process)
+    
+    def _finish_download(self, process):
+        """Handle trailing output and settle the final status once SteamCMD exits"""
+        if self._pending_output:
+            try:
+                self._handle_output(self._pending_output)
+            except Exception as e:
+                logger.error(f"Output monitor error: {str(e)}")
+            self._pending_output = b""
                 
-            elif "ERROR!" in line or "Failed" in line:
+        # Process has ended; also let any public link creation finish
+        process.wait()
+        for worker in self._workers:
+            worker.join()
+        with self._lock:
+            # Apps SteamCMD never reported on have failed
+            app_status = self.current_download["app_status"]
+            for game_id, status in app_status.items():
+                if status in ("queued", "downloading"):
+                    app_status[game_id] = "error"
+            
+            if self.current_download["status"] == "downloading":
+                # If it wasn't marked completed or error, but process ended
                 self.current_download["status"] = "error"
-                
-        # Process has ended
-        self.process.wait()
-        if self.current_download["status"] == "downloading":
-            # If it wasn't marked completed or error, but process ended
-            self.current_download["status"] = "error"
-            self.current_download["log"].append("Process ended unexpectedly")
-    
-    def _create_public_links(self):
-        """Create public links for downloaded files"""
+                self.current_download["log"].append("Process ended unexpectedly")
+            self._status_version += 1
+        self._running = False
+    
+    def _iter_manifest_entries(self, root, base):
+        """Yield manifest lines (paths relative to base) for all files under root"""
+        with os.scandir(root) as it:
+            for entry in it:
+                rel_path = os.path.relpath(entry.path, base)
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_manifest_entries(entry.path, base)
+                elif rel_path != "manifest.txt":
+                    yield f"{rel_path}\n"
+    
+    def _create_public_links(self, game_id):
+        """Create public links for a downloaded game's files"""
         try:
-            game_id = self.current_download["game_id"]
             game_dir = os.path.join(GAMES_DIR, f"app_{game_id}")
             public_game_dir = os.path.join(PUBLIC_DIR, f"app_{game_id}")
             
-            # Create a symbolic link or copy files
-            if os.path.exists(public_game_dir):
+            # A real directory left over from an older copy can't be replaced by a link
+            if os.path.isdir(public_game_dir) and not os.path.islink(public_game_dir):
                 shutil.rmtree(public_game_dir)
                 
-            # In Railway, create a symlink to the files
-            os.symlink(game_dir, public_game_dir, target_is_directory=True)
+            # In Railway, create a symlink to the files and swap it into place atomically
+            tmp_link = public_game_dir + ".tmp"
+            try:
+                os.unlink(tmp_link)
+            except FileNotFoundError:
+                pass
+            os.symlink(game_dir, tmp_link, target_is_directory=True)
+            os.replace(tmp_link, public_game_dir)
             
             # Generate the URLs (assuming Railway's public URL)
             railway_url = os.environ.get("RAILWAY_PUBLIC_URL", "http://localhost:7860")
@@ -285,57 +610,81 @@ class SteamCMDDownloader:
             
             # Create a manifest of all the files
             manifest_path = os.path.join(public_game_dir, "manifest.txt")
-            with open(manifest_path, 'w') as f:
-                for root, dirs, files in os.walk(game_dir):
-                    rel_path = os.path.relpath(root, game_dir)
-                    for file in files:
-                        file_path = os.path.join(rel_path, file)
-                        if file_path != "manifest.txt":
-                            f.write(f"{file_path}\n")
+            with open(manifest_path, 'w', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                f.writelines(self._iter_manifest_entries(game_dir, game_dir))
             
-            self.public_links = [
-                {
-                    "name": "Game Files Directory",
-                    "url": public_url
-                },
-                {
-                    "name": "Game Files Manifest",
-                    "url": f"{public_url}/manifest.txt"
-                }
-            ]
+            with self._lock:
+                self.public_links = self.public_links + [
+                    {
+                        "name": f"Game Files Directory (app {game_id})",
+                        "url": public_url
+                    },
+                    {
+                        "name": f"Game Files Manifest (app {game_id})",
+                        "url": f"{public_url}/manifest.txt"
+                    }
+                ]
+                self._status_version += 1
             
             logger.info(f"Public links created for game ID {game_id}")
             
         except Exception as e:
             logger.error(f"Failed to create public links: {str(e)}")
-            self.current_download["log"].append(f"Failed to create public links: {str(e)}")
+            with self._lock:
+                self.current_download["log"].append(f"Failed to create public links: {str(e)}")
     
     def get_download_status(self):
-        """Get the current download status"""
-        status = dict(self.current_download)
+        """Get a snapshot of the current download status"""
+        with self._lock:
+            version, cached = self._status_cache
+            if version != self._status_version:
+                # Rebuild the derived fields only when the download state has changed
+                version = self._status_version
+                status = dict(self.current_download)
+                del status["log"]  # Not rendered by the UI; see get_download_log()
+                status["version"] = version
+                status["completed_ids"] = list(status["completed_ids"])
+                status["app_status"] = dict(status["app_status"])
+                
+                # Format remaining time
+                if status["remaining_time"]:
+                    status["remaining_time"] = str(status["remaining_time"])
+                else:
+                    status["remaining_time"] = "calculating..."
+                    
+                # Add public links if available
+                status["public_links"] = self.public_links
+                self._status_cache = (version, status)
+                cached = status
+            
+        # Hand out a fresh (small) copy so callers never see the cache change under them
+        status = dict(cached)
         
-        # Add elapsed time
-        if status["start_time"]:
-            status["elapsed_time"] = str(datetime.now() - status["start_time"]).split('.')[0]
+        # Elapsed time changes on every call, so it is always refreshed
+        if status["start_time"] is not None:
+            elapsed_seconds = time.monotonic() - status["start_time"]
+            status["elapsed_time"] = str(timedelta(seconds=int(elapsed_seconds)))
         else:
             status["elapsed_time"] = "00:00:00"
-            
-        # Format remaining time
-        if status["remaining_time"]:
-            status["remaining_time"] = str(status["remaining_time"])
-        else:
-            status["remaining_time"] = "calculating..."
-            
-        # Add public links if available
-        status["public_links"] = self.public_links
         
         return status
     
+    def get_download_log(self):
+        """Get a copy of the recent SteamCMD output lines for the current download"""
+        with self._lock:
+            return list(self.current_download["log"])
+    
+    def is_running(self):
+        """Check whether a download is still being monitored (including link creation)"""
+        return self._running
+    
     def cancel_download(self):
         """Cancel the current download"""
         if self.process and self.process.poll() is None:
             self.process.terminate()
-            self.current_download["status"] = "cancelled"
+            with self._lock:
+                self.current_download["status"] = "cancelled"
+                self._status_version += 1
             logger.info("Download cancelled")
             return True
         return False
@@ -367,46 +716,67 @@ def start_download(username, password, game_input, anonymous):
     if not STEAMCMD_INSTALLED:
         return "SteamCMD not installed. Please install it first."
     
-    # Validate game input
-    game_id = downloader._extract_game_id(game_input)
-    if not game_id:
-        return "Invalid game ID or URL. Please provide a valid Steam app ID or URL."
+    # Validate game input (several IDs/URLs may be separated by commas or whitespace)
+    game_inputs = game_input.replace(",", " ").split()
+    if not game_inputs or not all(downloader._extract_game_id(entry) for entry in game_inputs):
+        return "Invalid game ID or URL. Please provide valid Steam app IDs or URLs."
     
-    # Check login first
-    login_success, login_message = downloader.login(username, password, anonymous)
-    if not login_success:
-        return login_message
-        
-    # Start download
-    success, message = downloader.download_game(game_input, username, password, anonymous)
+    # Start download (login happens in the same SteamCMD run; failures show up in the status)
+    success, message = downloader.download_game(game_inputs, username, password, anonymous)
     return message
 
-def update_status():
-    """Get the current download status for Gradio updates"""
-    status = downloader.get_download_status()
-    
-    # Format output for Gradio
+def format_status(status):
+    """Render a download status mapping as text for the Gradio status box"""
     if status["status"] == "idle":
         return "No active downloads"
     
     output = f"Status: {status['status'].upper()}\n"
     output += f"Game ID: {status['game_id']}\n"
+    if len(status["game_ids"]) > 1:
+        finished = [gid for gid, result in status["app_status"].items() if result in ("completed", "error")]
+        output += f"Queue: {len(finished)}/{len(status['game_ids'])} games done ({', '.join(status['game_ids'])})\n"
+        failed = [gid for gid, result in status["app_status"].items() if result == "error"]
+        if failed:
+            output += f"Failed: {', '.join(failed)}\n"
     output += f"Progress: {status['progress']:.1f}%\n"
     output += f"Size: {status['current_size']:.2f} MB / {status['total_size']:.2f} MB\n"
     output += f"Elapsed Time: {status['elapsed_time']}\n"
     output += f"Remaining Time: {status['remaining_time']}\n"
+    if status["error"]:
+        output += f"\nError: {status['error']}\n"
     
-    # Add links if completed
+    # Add links for every game that completed
     if status["status"] == "completed" and status["public_links"]:
         output += "\nDownload Complete! Public Links:\n"
-        for link in status["public_links"]:
-            output += f"- {link['name']}: {link['url']}\n"
+    elif status["public_links"]:
+        output += "\nPublic Links (completed games):\n"
+    for link in status["public_links"]:
+        output += f"- {link['name']}: {link['url']}\n"
     
     return output
 
-def get_progress():
-    """Get the current progress percentage for Gradio progress bar"""
-    return downloader.current_download["progress"]
+def refresh_status():
+    """Get the status text and progress percentage for Gradio in a single call"""
+    status = downloader.get_download_status()
+    return format_status(status), status["progress"]
+
+def poll_status(last_version):
+    """Push status updates from the UI timer, skipping ticks where nothing changed"""
+    status = downloader.get_download_status()
+    
+    # Elapsed time keeps moving while a download is running, so only idle ticks are skipped
+    if status["version"] == last_version and not downloader.is_running():
+        return gr.update(), gr.update(), last_version
+    
+    return format_status(status), status["progress"], status["version"]
+
+def poll_status_timer(last_version):
+    """Timer variant of poll_status that also stops the timer once the download is over"""
+    return (*poll_status(last_version), gr.Timer(active=downloader.is_running()))
+
+def resume_status_timer():
+    """Restart the status timer after a download has been started"""
+    return gr.Timer(active=True)
 
 def cancel_current_download():
     """Cancel the current download via Gradio"""
@@ -432,7 +802,7 @@ with gr.Blocks(title="SteamCMD Downloader") as app:
             anonymous = gr.Checkbox(label="Login Anonymously (for free games)")
             
         with gr.Column():
-            game_input = gr.Textbox(label="Game ID or URL", placeholder="Enter Steam App ID or URL")
+            game_input = gr.Textbox(label="Game ID or URL", placeholder="Enter Steam App IDs or URLs, separated by commas")
             download_button = gr.Button("Download Game")
             cancel_button = gr.Button("Cancel Download")
     
@@ -444,13 +814,22 @@ with gr.Blocks(title="SteamCMD Downloader") as app:
     
     # Hook up events
     install_button.click(install_steamcmd_gradio, outputs=steamcmd_status)
-    download_button.click(start_download, inputs=[username, password, game_input, anonymous], outputs=status_text)
+    download_event = download_button.click(start_download, inputs=[username, password, game_input, anonymous], outputs=status_text)
     cancel_button.click(cancel_current_download, outputs=status_text)
-    refresh_button.click(update_status, outputs=status_text)
-    refresh_button.click(get_progress, outputs=progress_bar)
+    refresh_button.click(refresh_status, outputs=[status_text, progress_bar])
+    
+    # Push status updates once a second (gr.Timer needs Gradio 4.40+)
+    last_status_version = gr.State(None)
+    poll_outputs = [status_text, progress_bar, last_status_version]
+    if hasattr(gr, "Timer"):
+        # The timer only ticks while a download is running
+        status_timer = gr.Timer(1.0, active=downloader.is_running())
+        status_timer.tick(poll_status_timer, inputs=last_status_version, outputs=poll_outputs + [status_timer])
+        download_event.then(resume_status_timer, outputs=status_timer)
+    else:
+        app.load(poll_status, inputs=last_status_version, outputs=poll_outputs, every=1)
     
-    # Add message about manual refresh
-    gr.Markdown("Click 'Refresh Status' to update download progress and status")
+    gr.Markdown("Status updates automatically; click 'Refresh Status' to update it immediately")
 
 # Launch the app
 if __name__ == "__main__":
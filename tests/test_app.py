@@ -0,0 +1,44 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("gradio")
+pytest.importorskip("requests")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    # app.py creates its working directories and log file relative to the cwd
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("app"))
+    try:
+        yield importlib.import_module("app")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def downloader(app_module):
+    downloader = app_module.SteamCMDDownloader()
+    downloader._create_public_links = lambda game_id: None
+    return downloader
+
+
+def test_mixed_case_app_error_advances_queue(downloader):
+    downloader._reset_download(["10", "20"])
+
+    downloader._feed_output(b"Error! App '10' state is 0x202 after update job.\n")
+    status = downloader.get_download_status()
+    assert status["app_status"] == {"10": "error", "20": "downloading"}
+    assert status["game_id"] == "20"
+    assert status["status"] == "preparing"
+
+    downloader._feed_output(b"Success! App '20' fully installed.\n")
+    status = downloader.get_download_status()
+    assert status["app_status"] == {"10": "error", "20": "completed"}
+    assert status["completed_ids"] == ["20"]
+    assert status["status"] == "error"